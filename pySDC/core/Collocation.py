@@ -1,4 +1,5 @@
 import logging
+import numbers
 
 import numpy as np
 import scipy.interpolate as intpl
@@ -6,6 +7,7 @@ import scipy.interpolate as intpl
 from pySDC.core.Nodes import NodesGenerator
 from pySDC.core.Errors import CollocationError
 from pySDC.core import LagrangeApproximation
+from pySDC.helpers.pysdc_helper import LRUCache
 
 
 class CollBase(object):
@@ -70,6 +72,9 @@ class CollBase(object):
         left_is_node (bool): flag to indicate whether left point is collocation node
     """
 
+    # class-level cache of nodes, weights and matrices, shared by all instances with the same parameters
+    tables = LRUCache(128)
+
     def __init__(self, num_nodes, tleft=0, tright=1,
                  node_type='LEGENDRE', quad_type='LOBATTO', useSpline=False):
         """
@@ -109,13 +114,33 @@ class CollBase(object):
             elif quad_type == 'LOBATTO':
                 self.order = 2 * num_nodes - 2
 
+        # the same collocation is usually set up for every step and level, so compute its tables only once
+        if isinstance(tleft, numbers.Number) and isinstance(tright, numbers.Number):
+            key = (type(self), num_nodes, tleft, tright, node_type, quad_type, useSpline)
+            tables = self.tables.get(key, lambda _: self._gen_tables(useSpline))
+        else:
+            tables = self._gen_tables(useSpline)
+        self.nodes, self.weights, self.Qmat, self.Smat, self.delta_m = [table.copy() for table in tables]
+        self.left_is_node = quad_type in ['LOBATTO', 'RADAU-LEFT']
+        self.right_is_node = quad_type in ['LOBATTO', 'RADAU-RIGHT']
+
+    def _gen_tables(self, useSpline):
+        """
+        Computes nodes, weights, integration matrices and node distances
+
+        Args:
+            useSpline (bool): flag to use spline interpolation for the integration matrix
+
+        Returns:
+            tuple of numpy.ndarray: nodes, weights, Qmat, Smat and delta_m
+        """
         self.nodes = self._getNodes
-        self.weights = self._getWeights(tleft, tright)
+        self.weights = self._getWeights(self.tleft, self.tright)
         self.Qmat = self._gen_Qmatrix_spline if useSpline else self._gen_Qmatrix
         self.Smat = self._gen_Smatrix
         self.delta_m = self._gen_deltas
-        self.left_is_node = quad_type in ['LOBATTO', 'RADAU-LEFT']
-        self.right_is_node = quad_type in ['LOBATTO', 'RADAU-RIGHT']
+
+        return self.nodes, self.weights, self.Qmat, self.Smat, self.delta_m
 
     @staticmethod
     def evaluate(weights, data):
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 
 class FrozenClass(object):
     """
@@ -28,3 +30,48 @@ class FrozenClass(object):
         Function to freeze the class
         """
         self.__isfrozen = True
+
+
+class LRUCache(object):
+    """
+    Helper class to store a limited number of objects built for hashable keys, dropping the least recently used
+    one when full
+
+    Attributes:
+        maxsize (int): maximal number of stored objects
+        __data (OrderedDict): the cached objects, least recently used first
+    """
+
+    def __init__(self, maxsize):
+        """
+        Initialization routine
+
+        Args:
+            maxsize (int): maximal number of stored objects
+        """
+        self.maxsize = maxsize
+        self.__data = OrderedDict()
+
+    def get(self, key, build):
+        """
+        Routine to return the object stored for key, computing and storing it via build(key) if necessary
+
+        Args:
+            key: hashable key identifying the object
+            build: function returning the object for a given key
+
+        Returns:
+            the (cached) object for key
+        """
+        if key in self.__data:
+            self.__data.move_to_end(key)
+        else:
+            # build first, so that a failing build does not evict a valid entry
+            value = build(key)
+            if len(self.__data) >= self.maxsize:
+                self.__data.popitem(last=False)
+            self.__data[key] = value
+        return self.__data[key]
+
+    def __len__(self):
+        return len(self.__data)
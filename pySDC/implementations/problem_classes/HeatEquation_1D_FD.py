@@ -1,9 +1,11 @@
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import spsolve
+from numba import jit
+from scipy.sparse.linalg import LinearOperator, cg
 
 from pySDC.core.Errors import ParameterError, ProblemError
 from pySDC.core.Problem import ptype
+from pySDC.helpers.pysdc_helper import LRUCache
 from pySDC.implementations.datatype_classes.mesh import mesh
 
 
@@ -16,6 +18,11 @@ class heat1d(ptype):
     Attributes:
         A: second-order FD discretization of the 1D laplace operator
         dx: distance between two spatial nodes
+        xvalues: spatial grid points
+        c: the stencil scaling nu/dx^2
+        ab: the three diagonals of A in banded storage (upper, main, lower)
+        thomas_factors (LRUCache): forward sweep coefficients of (I-factor*A), indexed by factor
+        work: scratch array for the matrix-free operator of the iterative solver (only if direct_solver is False)
     """
 
     def __init__(self, problem_params, dtype_u=mesh, dtype_f=mesh):
@@ -39,14 +46,38 @@ class heat1d(ptype):
         if (problem_params['nvars'] + 1) % 2 != 0:
             raise ProblemError('setup requires nvars = 2^p - 1')
 
+        if 'factor_cache_size' not in problem_params:
+            problem_params['factor_cache_size'] = 16
+        if 'direct_solver' not in problem_params:
+            problem_params['direct_solver'] = True
+        if 'lintol' not in problem_params:
+            problem_params['lintol'] = 1E-12
+        if 'liniter' not in problem_params:
+            problem_params['liniter'] = 10000
+
         # invoke super init, passing number of dofs, dtype_u and dtype_f
         super(heat1d, self).__init__(init=(problem_params['nvars'], None, np.dtype('float64')),
                                      dtype_u=dtype_u, dtype_f=dtype_f, params=problem_params)
 
         # compute dx and get discretization matrix A
         self.dx = 1.0 / (self.params.nvars + 1)
+        self.xvalues = np.arange(1, self.params.nvars + 1, dtype=np.float64) * self.dx
+        self.c = self.params.nu / self.dx ** 2
         self.A = self.__get_A(self.params.nvars, self.params.nu, self.dx)
 
+        # A is tridiagonal, so we keep its diagonals in banded form for the Thomas algorithm
+        self.ab = np.zeros((3, self.params.nvars))
+        self.ab[0, 1:] = self.A.diagonal(1)
+        self.ab[1, :] = self.A.diagonal(0)
+        self.ab[2, :-1] = self.A.diagonal(-1)
+
+        # SDC only uses a few distinct factors, so the forward sweep is done once per factor and reused
+        self.thomas_factors = LRUCache(self.params.factor_cache_size)
+
+        # the matrix-free operator of the iterative solver needs a scratch array for A*x
+        if not self.params.direct_solver:
+            self.work = np.zeros(self.params.nvars)
+
     @staticmethod
     def __get_A(N, nu, dx):
         """
@@ -58,14 +89,133 @@ class heat1d(ptype):
             dx (float): distance between two spatial nodes
 
         Returns:
-            scipy.sparse.csc_matrix: matrix A in CSC format
+            scipy.sparse.csr_matrix: matrix A in CSR format
         """
 
-        stencil = [1, -2, 1]
-        A = sp.diags(stencil, [-1, 0, 1], shape=(N, N), format='csc')
-        A *= nu / (dx ** 2)
+        # build the CSR arrays directly: row i holds the entries of columns i-1, i and i+1 (if inside the domain)
+        stencil = np.array([1.0, -2.0, 1.0]) * nu / (dx ** 2)
+        rows = np.arange(N)[:, None] + np.array([-1, 0, 1])
+        inside = (rows >= 0) & (rows < N)
+        indptr = np.concatenate(([0], np.cumsum(inside.sum(axis=1))))
+        data = np.broadcast_to(stencil, rows.shape)[inside]
+        A = sp.csr_matrix((data, rows[inside], indptr), shape=(N, N))
         return A
 
+    def __get_thomas_factors(self, factor):
+        """
+        Helper function to compute the factor-dependent coefficients of the Thomas algorithm for (I-factor*A)
+
+        Args:
+            factor (float): abbrev. for the local stepsize (or any other factor required)
+
+        Returns:
+            tuple of numpy.ndarray: lower diagonal, modified upper diagonal and inverse pivots
+        """
+
+        lower = -factor * self.ab[2, :]
+        upper = -factor * self.ab[0, :]
+        diag = 1.0 - factor * self.ab[1, :]
+
+        upper_mod, inv_piv = self.thomas_forward(lower, diag, upper)
+        return lower, upper_mod, inv_piv
+
+    @staticmethod
+    @jit(nopython=True, nogil=True)
+    def thomas_forward(lower, diag, upper):
+        """
+        Forward sweep of the Thomas algorithm, which only depends on the matrix
+
+        Args:
+            lower (numpy.ndarray): lower diagonal, lower[i] couples rows i+1 and i
+            diag (numpy.ndarray): main diagonal
+            upper (numpy.ndarray): upper diagonal, upper[i] couples rows i-1 and i
+
+        Returns:
+            tuple of numpy.ndarray: modified upper diagonal and inverse pivots
+        """
+
+        N = diag.shape[0]
+        upper_mod = np.zeros(N)
+        inv_piv = np.zeros(N)
+        inv_piv[0] = 1.0 / diag[0]
+        for i in range(1, N):
+            upper_mod[i - 1] = upper[i] * inv_piv[i - 1]
+            inv_piv[i] = 1.0 / (diag[i] - lower[i - 1] * upper_mod[i - 1])
+        return upper_mod, inv_piv
+
+    @staticmethod
+    @jit(nopython=True, nogil=True)
+    def thomas(lower, upper_mod, inv_piv, rhs, out):
+        """
+        Thomas algorithm for a tridiagonal system with precomputed forward sweep coefficients
+
+        Args:
+            lower (numpy.ndarray): lower diagonal, lower[i] couples rows i+1 and i
+            upper_mod (numpy.ndarray): modified upper diagonal from the forward sweep
+            inv_piv (numpy.ndarray): inverse pivots from the forward sweep
+            rhs (numpy.ndarray): right-hand side
+            out (numpy.ndarray): array to store the solution in
+        """
+
+        N = rhs.shape[0]
+        out[0] = rhs[0] * inv_piv[0]
+        for i in range(1, N):
+            out[i] = (rhs[i] - lower[i - 1] * out[i - 1]) * inv_piv[i]
+        for i in range(N - 2, -1, -1):
+            out[i] -= upper_mod[i] * out[i + 1]
+
+    def apply_A(self, u, out):
+        """
+        Routine to apply A to u via the 3-point stencil, avoiding the sparse matrix-vector product
+
+        Args:
+            u (numpy.ndarray): values to apply A to
+            out (numpy.ndarray): array to store the result in
+        """
+
+        # work on plain views, since mesh does not support ufuncs with out
+        u = np.asarray(u)
+        out = out.view(np.ndarray)
+        np.multiply(u, -2.0, out=out)
+        out[1:] += u[:-1]
+        out[:-1] += u[1:]
+        out *= self.c
+
+    def __get_system_operator(self, factor):
+        """
+        Helper function to represent (I-factor*A) matrix-free, using the stencil
+
+        Args:
+            factor (float): abbrev. for the local stepsize (or any other factor required)
+
+        Returns:
+            scipy.sparse.linalg.LinearOperator: the system operator
+        """
+
+        def matvec(x):
+            # only the returned array is new, A*x goes to the persistent work buffer
+            self.apply_A(x, self.work)
+            self.work *= -factor
+            return np.add(x, self.work)
+
+        N = self.params.nvars
+        return LinearOperator((N, N), matvec=matvec, dtype=np.float64)
+
+    def __get_jacobi_preconditioner(self, factor):
+        """
+        Helper function to get the Jacobi preconditioner for (I-factor*A), i.e. the inverse of its (constant) diagonal
+
+        Args:
+            factor (float): abbrev. for the local stepsize (or any other factor required)
+
+        Returns:
+            scipy.sparse.linalg.LinearOperator: the preconditioner
+        """
+
+        inv_diag = 1.0 / (1.0 + 2.0 * factor * self.c)
+        N = self.params.nvars
+        return LinearOperator((N, N), matvec=lambda x: inv_diag * x, dtype=np.float64)
+
     def eval_f(self, u, t):
         """
         Routine to evaluate the RHS
@@ -79,7 +229,7 @@ class heat1d(ptype):
         """
 
         f = self.dtype_f(self.init)
-        f[:] = self.A.dot(u)
+        self.apply_A(u, f)
         return f
 
     def solve_system(self, rhs, factor, u0, t):
@@ -97,7 +247,14 @@ class heat1d(ptype):
         """
 
         me = self.dtype_u(self.init)
-        me[:] = spsolve(sp.eye(self.params.nvars, format='csc') - factor * self.A, rhs)
+
+        if self.params.direct_solver:
+            lower, upper_mod, inv_piv = self.thomas_factors.get(factor, self.__get_thomas_factors)
+            self.thomas(lower, upper_mod, inv_piv, np.asarray(rhs), me.view(np.ndarray))
+        else:
+            me[:] = cg(self.__get_system_operator(factor), np.asarray(rhs), x0=np.asarray(u0),
+                       tol=self.params.lintol, maxiter=self.params.liniter,
+                       M=self.__get_jacobi_preconditioner(factor))[0]
         return me
 
     def u_exact(self, t):
@@ -113,9 +270,8 @@ class heat1d(ptype):
 
         me = self.dtype_u(self.init)
         if self.params.freq >= 0:
-            xvalues = np.array([(i + 1) * self.dx for i in range(self.params.nvars)])
             rho = (2.0 - 2.0 * np.cos(np.pi * self.params.freq * self.dx)) / self.dx ** 2
-            me[:] = np.sin(np.pi * self.params.freq * xvalues) * \
+            me[:] = np.sin(np.pi * self.params.freq * self.xvalues) * \
                 np.exp(-t * self.params.nu * rho)
         else:
             np.random.seed(1)
@@ -9,6 +9,10 @@ class heat1d_forced(heat1d):
     """
     Example implementing the forced 1D heat equation with Dirichlet-0 BC in [0,1],
     discretized using central finite differences
+
+    Attributes:
+        sinx: spatial part sin(pi*freq*x) of the forcing term and the exact solution
+        nuk2: the scaling nu*(pi*freq)^2 of the cosine contribution to the forcing term
     """
     def __init__(self, problem_params, dtype_u=mesh, dtype_f=imex_mesh):
         """
@@ -23,9 +27,9 @@ class heat1d_forced(heat1d):
         # invoke super init, passing number of dofs, dtype_u and dtype_f
         super(heat1d_forced, self).__init__(problem_params, dtype_u, dtype_f)
 
-        self.xvalues = np.array([(i + 1) * self.dx for i in range(self.params.nvars)])
-
-        pass
+        # the spatial part of the forcing does not depend on time, so compute it only once
+        self.sinx = np.sin(np.pi * self.params.freq * self.xvalues)
+        self.nuk2 = self.params.nu * (np.pi * self.params.freq) ** 2
 
     def eval_f(self, u, t):
         """
@@ -40,43 +44,10 @@ class heat1d_forced(heat1d):
         """
 
         f = self.dtype_f(self.init)
-        f.impl = self.__eval_fimpl(u, t)
-        f.expl = self.__eval_fexpl(u, t)
+        self.apply_A(u, f.impl)
+        np.multiply(self.sinx, -(np.sin(t) - self.nuk2 * np.cos(t)), out=f.expl.view(np.ndarray))
         return f
 
-    def __eval_fexpl(self, u, t):
-        """
-        Helper routine to evaluate the explicit part of the RHS
-
-        Args:
-            u (dtype_u): current values (not used here)
-            t (float): current time
-
-        Returns:
-            dtype_f: explicit part of RHS
-        """
-
-        fexpl = self.dtype_u(self.init)
-        fexpl[:] = -np.sin(np.pi * self.params.freq * self.xvalues) * \
-            (np.sin(t) - self.params.nu * (np.pi * self.params.freq) ** 2 * np.cos(t))
-        return fexpl
-
-    def __eval_fimpl(self, u, t):
-        """
-        Helper routine to evaluate the implicit part of the RHS
-
-        Args:
-            u (dtype_u): current values
-            t (float): current time (not used here)
-
-        Returns:
-            dtype_f: implicit part of RHS
-        """
-
-        fimpl = self.dtype_u(self.init)
-        fimpl[:] = self.A.dot(u)
-        return fimpl
-
     def u_exact(self, t):
         """
         Routine to compute the exact solution at time t
@@ -89,5 +60,5 @@ class heat1d_forced(heat1d):
         """
 
         me = self.dtype_u(self.init)
-        me[:] = np.sin(np.pi * self.params.freq * self.xvalues) * np.cos(t)
+        me[:] = self.sinx * np.cos(t)
         return me
@@ -1,10 +1,12 @@
 
 import numpy as np
 import scipy.sparse as sp
+from numba import jit
 from scipy.sparse.linalg import splu
 
 from pySDC.core.Errors import ParameterError, ProblemError
 from pySDC.core.Problem import ptype
+from pySDC.helpers.pysdc_helper import LRUCache
 from pySDC.implementations.datatype_classes.mesh import mesh
 
 
@@ -17,6 +19,10 @@ class heat1d_periodic(ptype):
     Attributes:
         A: second-order FD discretization of the 1D laplace operator
         dx: distance between two spatial nodes
+        xvalues: spatial grid points
+        c: the stencil scaling nu/dx^2
+        Id: sparse identity matrix in CSC format
+        lu_factors (LRUCache): LU factorizations of (I-factor*A), indexed by factor
     """
     def __init__(self, problem_params, dtype_u=mesh, dtype_f=mesh):
         """
@@ -41,13 +47,22 @@ class heat1d_periodic(ptype):
         if problem_params['nvars'] % 2 != 0:
             raise ProblemError('the setup requires nvars = 2^p per dimension')
 
+        if 'factor_cache_size' not in problem_params:
+            problem_params['factor_cache_size'] = 16
+
         # invoke super init, passing number of dofs, dtype_u and dtype_f
         super(heat1d_periodic, self).__init__(init=(problem_params['nvars'], None, np.dtype('float64')),
                                               dtype_u=dtype_u, dtype_f=dtype_f, params=problem_params)
 
         # compute dx (equal in both dimensions) and get discretization matrix A
         self.dx = 1.0 / self.params.nvars
+        self.xvalues = np.arange(self.params.nvars, dtype=np.float64) * self.dx
+        self.c = self.params.nu / self.dx ** 2
         self.A = self.__get_A(self.params.nvars, self.params.nu, self.dx)
+        self.Id = sp.eye(self.params.nvars, format='csc')
+
+        # SDC only uses a few distinct factors, so we factorize each system matrix once and reuse it
+        self.lu_factors = LRUCache(self.params.factor_cache_size)
 
     @staticmethod
     def __get_A(N, nu, dx):
@@ -60,21 +75,48 @@ class heat1d_periodic(ptype):
             dx (float): distance between two spatial nodes
 
         Returns:
-            scipy.sparse.csc_matrix: matrix A in CSC format
+            scipy.sparse.csr_matrix: matrix A in CSR format
         """
 
-        stencil = [1, -2, 1]
-        zero_pos = 2
-        dstencil = np.concatenate((stencil, np.delete(stencil, zero_pos - 1)))
-        offsets = np.concatenate(([N - i - 1 for i in reversed(range(zero_pos - 1))],
-                                  [i - zero_pos + 1 for i in range(zero_pos - 1, len(stencil))]))
-        doffsets = np.concatenate((offsets, np.delete(offsets, zero_pos - 1) - N))
-
-        A = sp.diags(dstencil, doffsets, shape=(N, N), format='csc')
-        A *= nu / (dx ** 2)
+        # build the CSR arrays directly: row i holds the entries of columns i-1, i and i+1 (modulo N)
+        stencil = np.array([1.0, -2.0, 1.0]) * nu / (dx ** 2)
+        rows = (np.arange(N)[:, None] + np.array([-1, 0, 1])) % N
+        indptr = np.arange(0, 3 * N + 1, 3)
+        A = sp.csr_matrix((np.tile(stencil, N), rows.ravel(), indptr), shape=(N, N))
+        # wrap-around entries are out of order in the first and last row
+        A.sum_duplicates()
 
         return A
 
+    @staticmethod
+    @jit(nopython=True, nogil=True)
+    def fast_apply_A(u, out, c):
+        """
+        Periodic 3-point stencil including the scaling, in a single pass over the data
+
+        Args:
+            u (numpy.ndarray): values to apply A to
+            out (numpy.ndarray): array to store the result in
+            c (float): the stencil scaling nu/dx^2
+        """
+
+        N = u.shape[0]
+        for i in range(1, N - 1):
+            out[i] = c * (u[i - 1] - 2.0 * u[i] + u[i + 1])
+        out[0] = c * (u[N - 1] - 2.0 * u[0] + u[1])
+        out[N - 1] = c * (u[N - 2] - 2.0 * u[N - 1] + u[0])
+
+    def apply_A(self, u, out):
+        """
+        Routine to apply A to u via the periodic 3-point stencil, avoiding the sparse matrix-vector product
+
+        Args:
+            u (numpy.ndarray): values to apply A to
+            out (numpy.ndarray): array to store the result in
+        """
+
+        self.fast_apply_A(np.asarray(u), out.view(np.ndarray), self.c)
+
     def eval_f(self, u, t):
         """
         Routine to evaluate the RHS
@@ -88,7 +130,7 @@ class heat1d_periodic(ptype):
         """
 
         f = self.dtype_f(self.init)
-        f[:] = self.A.dot(u)
+        self.apply_A(u, f)
         return f
 
     def solve_system(self, rhs, factor, u0, t):
@@ -106,7 +148,7 @@ class heat1d_periodic(ptype):
         """
 
         me = self.dtype_u(self.init)
-        L = splu(sp.eye(self.params.nvars, format='csc') - factor * self.A)
+        L = self.lu_factors.get(factor, lambda fac: splu((self.Id - fac * self.A).tocsc()))
         me[:] = L.solve(rhs[:])
         return me
 
@@ -124,9 +166,8 @@ class heat1d_periodic(ptype):
         me = self.dtype_u(self.init)
 
         if self.params.freq >= 0:
-            xvalues = np.array([i * self.dx for i in range(self.params.nvars)])
             rho = (2.0 - 2.0 * np.cos(np.pi * self.params.freq * self.dx)) / self.dx ** 2
-            me[:] = np.sin(np.pi * self.params.freq * xvalues) * \
+            me[:] = np.sin(np.pi * self.params.freq * self.xvalues) * \
                 np.exp(-t * self.params.nu * rho)
         else:
             np.random.seed(1)
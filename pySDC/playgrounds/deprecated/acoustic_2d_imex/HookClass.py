@@ -1,3 +1,4 @@
+import numpy as np
 from matplotlib import cm
 from matplotlib import pyplot as plt
 
@@ -16,6 +17,9 @@ class plot_solution(hooks):
         #        self.fig = plt.figure(figsize=(18,6))
         self.fig = plt.figure(figsize=(9,9))
 
+        # plot artists, created in the first call of post_step and then reused
+        self.mesh = None
+        self.cbar = None
 
     def post_step(self, status):
         """
@@ -37,18 +41,25 @@ class plot_solution(hooks):
           
         if True:
           yplot = self.level.uend.values
-          xx    = self.level.prob.xx
-          zz    = self.level.prob.zz
-          self.fig.clear()
-          CS = plt.contourf(xx, zz, yplot[2,:,:], rstride=1, cstride=1, cmap=cm.coolwarm, linewidth=0, antialiased=False)
-          cbar = plt.colorbar(CS)
-          plt.axes().set_xlim(xmin = self.level.prob.x_bounds[0], xmax = self.level.prob.x_bounds[1])
-          plt.axes().set_ylim(ymin = self.level.prob.z_bounds[0], ymax = self.level.prob.z_bounds[1])
-          plt.axes().set_aspect('equal')
-          plt.xlabel('x')
-          plt.ylabel('z')
-          #plt.tight_layout()
-          plt.show(block=False)
-          plt.pause(0.00001)
+          # single precision is plenty for plotting and halves the data handed to matplotlib
+          data = np.ascontiguousarray(yplot[2,:,:], dtype=np.float32)
+          if self.mesh is None:
+            # first call: set up axes, mesh and colorbar once, later steps only update the data
+            xx    = self.level.prob.xx
+            zz    = self.level.prob.zz
+            ax = self.fig.add_subplot(111)
+            self.mesh = ax.pcolormesh(xx, zz, data, cmap=cm.coolwarm, shading='gouraud')
+            self.cbar = self.fig.colorbar(self.mesh, ax=ax)
+            ax.set_xlim(xmin = self.level.prob.x_bounds[0], xmax = self.level.prob.x_bounds[1])
+            ax.set_ylim(ymin = self.level.prob.z_bounds[0], ymax = self.level.prob.z_bounds[1])
+            ax.set_aspect('equal')
+            ax.set_xlabel('x')
+            ax.set_ylabel('z')
+            plt.show(block=False)
+          else:
+            self.mesh.set_array(data)
+            self.mesh.autoscale()
+          self.fig.canvas.draw_idle()
+          self.fig.canvas.flush_events()
 
         return None
@@ -58,6 +58,7 @@ class sharpclaw(ptype):
         self.solver.setup(solution)
 
         self.A = self.__get_A(self.nvars,self.nu,self.dx)
+        self.Id = sp.eye(self.nvars, format='csc')
 
 
     def __get_A(self,N,nu,dx):
@@ -94,7 +95,7 @@ class sharpclaw(ptype):
         """
 
         me = mesh(self.nvars)
-        me.values = LA.spsolve(sp.eye(self.nvars)-factor*self.A,rhs.values)
+        me.values = LA.spsolve(self.Id-factor*self.A,rhs.values)
 
         return me
 
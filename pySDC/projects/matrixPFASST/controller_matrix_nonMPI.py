@@ -101,9 +101,20 @@ class controller_matrix_nonMPI(controller_nonMPI):
                 np.kron(E, np.kron(Nc, np.eye(self.nspace_c)))
             self.Pc = np.array(self.Pc)
 
-        self.u = np.zeros(self.nsteps * self.nnodes * self.nspace)
-        self.res = np.zeros(self.nsteps * self.nnodes * self.nspace)
-        self.u0 = np.zeros(self.nsteps * self.nnodes * self.nspace)
+        # buffers for the composite vectors, reused for all blocks (and possibly complex, e.g. for the test equation)
+        dtype = np.result_type(self.C.dtype, prob.init[2])
+        self.u = np.zeros(self.nsteps * self.nnodes * self.nspace, dtype=dtype)
+        self.res = np.zeros(self.nsteps * self.nnodes * self.nspace, dtype=dtype)
+        self.u0 = np.zeros(self.nsteps * self.nnodes * self.nspace, dtype=dtype)
+
+        # C has Kronecker structure, so the residual can be computed per step and node on (nsteps, nnodes, nspace)
+        # blocks instead of with the large dense matrix, see compute_residual
+        self.Q = np.ascontiguousarray(Q)
+        self.AT = np.ascontiguousarray(np.asarray(A).T)
+        self.work = np.zeros((self.nsteps, self.nnodes, self.nspace), dtype=dtype)
+
+        # buffer for the absolute values of the residual, used for the max-norms
+        self.res_abs = np.zeros(self.nsteps * self.nnodes * self.nspace)
 
     def run(self, u0, t0, Tend):
         """
@@ -236,17 +247,39 @@ class controller_matrix_nonMPI(controller_nonMPI):
                     lvl.u[m] = P.dtype_u(init=P.init, val=0.0)
                     lvl.f[m] = P.dtype_f(init=P.init, val=0.0)
 
-        self.u0 = np.kron(np.concatenate([[1], [0] * (self.nsteps - 1)]), np.kron(np.ones(self.nnodes), u0))
+        # u0 lives at all nodes of the first step only, the buffers are reused across blocks
+        self.u0[:] = 0.0
+        self.u0[:self.nnodes * self.nspace] = np.tile(u0, self.nnodes)
 
         if self.MS[0].levels[0].sweep.params.initial_guess == 'spread':
-            self.u = np.kron(np.ones(self.nsteps * self.nnodes), u0)
+            self.u[:] = np.tile(u0, self.nsteps * self.nnodes)
         else:
-            self.u = self.u0.copy()
+            self.u[:] = self.u0
+
+        self.res[:] = 0.0
+
+    def compute_residual(self):
+        """
+        Helper routine to compute the residual u0 - C*u of the composite collocation problem in place
+
+        With C = I - dt * (I x Q x A) - (E x N x I), this is done blockwise: per step, the collocation part is
+        Q * U * A^T for the (nnodes, nspace) block U, and the coupling adds the last node of the previous step.
+        """
+
+        shape = (self.nsteps, self.nnodes, self.nspace)
+        u = self.u.reshape(shape)
+        res = self.res.reshape(shape)
+
+        np.matmul(self.Q, u, out=self.work)
+        np.matmul(self.work, self.AT, out=res)
+        res *= self.dt
+        res += self.u0.reshape(shape)
+        res -= u
+        res[1:] += u[:-1, -1:, :]
 
-        self.res = np.zeros(self.nsteps * self.nnodes * self.nspace)
+    def update_data(self, MS, u, res, niter, level, stage):
 
-    @staticmethod
-    def update_data(MS, u, res, niter, level, stage):
+        res_abs = np.abs(res, out=self.res_abs)
 
         for S in MS:
             S.status.stage = stage
@@ -260,7 +293,7 @@ class controller_matrix_nonMPI(controller_nonMPI):
             first = S.status.slot * nnodes * nspace
             last = (S.status.slot + 1) * nnodes * nspace
 
-            L.status.residual = np.linalg.norm(res[first:last], np.inf)
+            L.status.residual = res_abs[first:last].max()
 
             for m in range(1, nnodes + 1):
                 mstart = first + (m - 1) * nspace
@@ -285,13 +318,13 @@ class controller_matrix_nonMPI(controller_nonMPI):
 
         niter = 0
 
-        self.res = self.u0 - self.C.dot(self.u)
+        self.compute_residual()
 
         MS = self.update_data(MS=MS, u=self.u, res=self.res, niter=niter, level=0, stage='PRE_STEP')
         for S in MS:
             self.hooks.pre_step(step=S, level_number=0)
 
-        while np.linalg.norm(self.res, np.inf) > self.tol and niter < self.maxiter:
+        while np.abs(self.res, out=self.res_abs).max() > self.tol and niter < self.maxiter:
 
             niter += 1
 
@@ -307,7 +340,7 @@ class controller_matrix_nonMPI(controller_nonMPI):
                         self.hooks.pre_sweep(step=S, level_number=1)
 
                     self.u += self.Tcf.dot(np.linalg.solve(self.Pc, self.Tfc.dot(self.res)))
-                    self.res = self.u0 - self.C.dot(self.u)
+                    self.compute_residual()
 
                     MS = self.update_data(MS=MS, u=self.u, res=self.res, niter=niter, level=1,
                                           stage='POST_COARSE_SWEEP')
@@ -321,7 +354,7 @@ class controller_matrix_nonMPI(controller_nonMPI):
                     self.hooks.pre_sweep(step=S, level_number=0)
 
                 self.u += np.linalg.solve(self.P, self.res)
-                self.res = self.u0 - self.C.dot(self.u)
+                self.compute_residual()
 
                 MS = self.update_data(MS=MS, u=self.u, res=self.res, niter=niter, level=0, stage='POST_FINE_SWEEP')
                 for S in MS:
@@ -124,3 +124,39 @@ def test_partialquadraturewithS(collclass):
             int_ex = np.polyval(poly_int_coeff, coll.nodes[i]) - np.polyval(poly_int_coeff, coll.nodes[i-1])
             int_coll = np.dot(poly_vals, S[i,:])
             assert abs(int_ex - int_coll) < tolQuad, "For node type " + coll.__class__.__name__ + ", partial quadrature rule from Smat failed to integrate polynomial of degree M-1 exactly for M = " + str(M)
+
+
+@pytest.mark.parametrize("collclass", classes)
+def test_cachedtablesareindependent(collclass):
+    M = 5
+    coll1 = collclass(M, 0.0, 0.5)
+    coll2 = collclass(M, 0.0, 0.5)
+    for attr in ['nodes', 'weights', 'Qmat', 'Smat', 'delta_m']:
+        table1 = getattr(coll1, attr)
+        table2 = getattr(coll2, attr)
+        assert np.array_equal(table1, table2), "For node type " + coll1.__class__.__name__ + ", " + attr + \
+            " differs between two instances with the same parameters"
+        assert not np.shares_memory(table1, table2), "For node type " + coll1.__class__.__name__ + ", " + attr + \
+            " is shared between two instances"
+    coll1.Qmat[:] = 0.0
+    assert np.array_equal(coll2.Qmat, collclass(M, 0.0, 0.5).Qmat), "For node type " + \
+        coll1.__class__.__name__ + ", changing Qmat of one instance changed the cached tables"
+
+
+def test_equidistantRDC():
+    from pySDC.projects.RDC.equidistant_RDC import Equidistant_RDC
+
+    tleft, tright = 0.0, 1.0
+    # construct twice, so that the second instance is served from the collocation cache
+    colls = [Equidistant_RDC(7, tleft, tright) for _ in range(2)]
+    for coll in colls:
+        assert abs(coll.nodes[0] - tleft) < tolQuad and abs(coll.nodes[-1] - tright) < tolQuad, \
+            "Equidistant_RDC nodes do not include the interval boundaries"
+        assert abs(np.sum(coll.weights) - (tright - tleft)) < tolQuad, "Equidistant_RDC weights do not sum up"
+        assert np.allclose(coll.Qmat[1:, 1:].sum(axis=1), coll.nodes - tleft, atol=tolQuad), \
+            "Equidistant_RDC Qmat does not integrate constants"
+        assert np.allclose(coll.Smat[1:, 1:].sum(axis=1), coll.delta_m, atol=tolQuad), \
+            "Equidistant_RDC Smat does not integrate constants"
+    for attr in ['nodes', 'weights', 'Qmat', 'Smat', 'delta_m']:
+        assert np.array_equal(getattr(colls[0], attr), getattr(colls[1], attr)), \
+            "Equidistant_RDC %s differ between cached and uncached construction" % attr
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from scipy.sparse.linalg import spsolve
+
+from pySDC.implementations.problem_classes.HeatEquation_1D_FD import heat1d
+from pySDC.implementations.problem_classes.HeatEquation_1D_FD_forced import heat1d_forced
+from pySDC.implementations.problem_classes.HeatEquation_1D_FD_periodic import heat1d_periodic
+
+factors = [1E-04, 0.01, 0.5, 10.0]
+
+
+def get_rhs(nvars):
+    np.random.seed(1)
+    return np.random.rand(nvars)
+
+
+@pytest.mark.parametrize("nvars", [1, 3, 127])
+def test_thomas_solver(nvars):
+    problem_params = {'nvars': nvars, 'nu': 0.1, 'freq': -1}
+    prob = heat1d(problem_params)
+
+    rhs = prob.dtype_u(prob.init)
+    rhs[:] = get_rhs(nvars)
+
+    for factor in factors:
+        ref = spsolve(sp.eye(nvars, format='csc') - factor * prob.A, np.asarray(rhs))
+        uex = prob.solve_system(rhs, factor, rhs, 0.0)
+        err = np.linalg.norm(uex - ref, np.inf)
+        assert err < 1E-12 * max(1.0, np.linalg.norm(ref, np.inf)), \
+            'ERROR: Thomas solver deviates from spsolve for factor %s, got %s' % (factor, err)
+
+        # a second call with the same factor has to reuse the cached forward sweep without modifying it
+        cached = [np.copy(v) for v in prob.thomas_factors.get(factor, None)]
+        uex2 = prob.solve_system(rhs, factor, rhs, 0.0)
+        assert np.array_equal(uex, uex2), 'ERROR: second solve with factor %s gave a different result' % factor
+        for old, new in zip(cached, prob.thomas_factors.get(factor, None)):
+            assert np.array_equal(old, new), 'ERROR: cached forward sweep for factor %s was modified' % factor
+
+    assert len(prob.thomas_factors) == len(factors), \
+        'ERROR: expected one cached forward sweep per factor, got %s' % len(prob.thomas_factors)
+
+
+@pytest.mark.parametrize("problem_class, nvars", [(heat1d, 1), (heat1d, 127), (heat1d_periodic, 4),
+                                                  (heat1d_periodic, 128), (heat1d_forced, 127)])
+def test_stencil_matches_matrix(problem_class, nvars):
+    problem_params = {'nvars': nvars, 'nu': 0.1, 'freq': 2}
+    prob = problem_class(problem_params)
+
+    u = prob.dtype_u(prob.init)
+    u[:] = get_rhs(nvars)
+
+    f = prob.eval_f(u, 0.0)
+    if problem_class is heat1d_forced:
+        f = f.impl
+    ref = prob.A.dot(np.asarray(u))
+    err = np.linalg.norm(f - ref, np.inf)
+    assert err < 1E-12 * np.linalg.norm(ref, np.inf), \
+        'ERROR: stencil of %s deviates from A for nvars=%s, got %s' % (problem_class.__name__, nvars, err)
+
+
+@pytest.mark.parametrize("nvars", [127, 255])
+def test_iterative_solver(nvars):
+    problem_params = {'nvars': nvars, 'nu': 0.1, 'freq': -1, 'direct_solver': True}
+    prob_direct = heat1d(problem_params)
+    problem_params = {'nvars': nvars, 'nu': 0.1, 'freq': -1, 'direct_solver': False, 'lintol': 1E-12}
+    prob_iter = heat1d(problem_params)
+
+    rhs = prob_direct.dtype_u(prob_direct.init)
+    rhs[:] = get_rhs(nvars)
+
+    for factor in [0.001, 0.1]:
+        u_direct = prob_direct.solve_system(rhs, factor, rhs, 0.0)
+        u_iter = prob_iter.solve_system(rhs, factor, rhs, 0.0)
+        err = np.linalg.norm(u_direct - u_iter, np.inf)
+        # CG stops on the relative residual, so the error may exceed lintol by the condition number of (I-factor*A)
+        assert err < 1E-09 * np.linalg.norm(u_direct, np.inf), \
+            'ERROR: iterative and direct solver differ for factor %s, got %s' % (factor, err)
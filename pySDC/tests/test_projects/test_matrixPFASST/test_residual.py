@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+import pySDC.projects.matrixPFASST.compare_to_matrixbased as setups
+from pySDC.projects.matrixPFASST.controller_matrix_nonMPI import controller_matrix_nonMPI
+
+
+@pytest.mark.parametrize("setup", ['diffusion', 'testequation'])
+def test_blockwise_residual(setup):
+    if setup == 'diffusion':
+        description, controller_params = setups.diffusion_setup(par=0.1)
+    else:
+        description, controller_params = setups.testequation_setup()
+
+    controller = controller_matrix_nonMPI(num_procs=4, controller_params=controller_params, description=description)
+    assert controller.nlevels == 2, 'ERROR: expected 2 levels, got %s' % controller.nlevels
+
+    np.random.seed(1)
+    n = controller.u.shape[0]
+    if np.iscomplexobj(controller.u):
+        controller.u[:] = np.random.rand(n) + 1j * np.random.rand(n)
+        controller.u0[:] = np.random.rand(n) + 1j * np.random.rand(n)
+    else:
+        controller.u[:] = np.random.rand(n)
+        controller.u0[:] = np.random.rand(n)
+
+    controller.compute_residual()
+    ref = controller.u0 - controller.C.dot(controller.u)
+
+    err = np.linalg.norm(controller.res - ref, np.inf)
+    tol = 100 * np.finfo(float).eps * np.linalg.norm(controller.C, np.inf) * np.linalg.norm(controller.u, np.inf)
+    assert err < tol, 'ERROR: blockwise residual deviates from u0 - C*u for %s setup, got %s' % (setup, err)
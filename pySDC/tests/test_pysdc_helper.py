@@ -0,0 +1,60 @@
+import pytest
+
+from pySDC.helpers.pysdc_helper import LRUCache
+
+
+def test_cache_reuses_entries():
+    calls = []
+
+    def build(key):
+        calls.append(key)
+        return [key]
+
+    cache = LRUCache(2)
+    first = cache.get(1.0, build)
+    assert cache.get(1.0, build) is first, 'ERROR: cached object was not reused'
+    assert calls == [1.0], 'ERROR: build was called for a cached key, got %s' % calls
+    assert len(cache) == 1
+
+
+def test_cache_evicts_least_recently_used():
+    calls = []
+
+    def build(key):
+        calls.append(key)
+        return key
+
+    cache = LRUCache(2)
+    cache.get('a', build)
+    cache.get('b', build)
+    # touch 'a', so that 'b' becomes the least recently used entry
+    cache.get('a', build)
+    cache.get('c', build)
+    assert len(cache) == 2, 'ERROR: cache exceeds its maximal size, got %s entries' % len(cache)
+
+    del calls[:]
+    cache.get('a', build)
+    cache.get('c', build)
+    assert calls == [], 'ERROR: recently used entries were evicted, rebuilt %s' % calls
+    cache.get('b', build)
+    assert calls == ['b'], 'ERROR: least recently used entry was not evicted, rebuilt %s' % calls
+
+
+def test_cache_keeps_entries_if_build_fails():
+    def build(key):
+        if key == 'bad':
+            raise AttributeError('cannot build %s' % key)
+        return key
+
+    cache = LRUCache(2)
+    cache.get('a', build)
+    cache.get('b', build)
+    with pytest.raises(AttributeError):
+        cache.get('bad', build)
+    assert len(cache) == 2, 'ERROR: failing build changed the cache, got %s entries' % len(cache)
+
+    def fail(key):
+        raise AssertionError('ERROR: entry %s was evicted by a failing build' % key)
+
+    cache.get('a', fail)
+    cache.get('b', fail)